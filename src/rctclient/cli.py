@@ -86,7 +86,7 @@ def receive_frame(sock: socket.socket, timeout: int = 2) -> ReceiveFrame:
             raise
 
         if ready_read:
-            buf = sock.recv(1024)
+            buf = sock.recv(4096)
             if len(buf) > 0:
                 log.debug('Received %d bytes: %s', len(buf), buf.hex())
                 i = frame.consume(buf)
@@ -173,10 +173,10 @@ def read_value(ctx, port: int, host: str, id: Optional[str], name: Optional[str]
     is_ts = oinfo.response_data_type == DataType.TIMESERIES
     is_ev = oinfo.response_data_type == DataType.EVENT_TABLE
     if is_ts or is_ev:
-        sock.send(make_frame(command=Command.WRITE, id=oinfo.object_id,
-                             payload=encode_value(DataType.INT32, int(datetime.now().timestamp()))))
+        sock.sendall(make_frame(command=Command.WRITE, id=oinfo.object_id,
+                                payload=encode_value(DataType.INT32, int(datetime.now().timestamp()))))
     else:
-        sock.send(make_frame(command=Command.READ, id=oinfo.object_id))
+        sock.sendall(make_frame(command=Command.READ, id=oinfo.object_id))
     try:
         rframe = receive_frame(sock)
     except FrameCRCMismatch as exc:
@@ -29,6 +29,9 @@ FRAME_LENGTH_CRC16 = 2
 #: Amount of bytes we need to have a command
 BUFFER_LEN_COMMAND = 2
 
+#: Plain-int to member mapping, avoids going through ``Command(...)`` for every received frame
+_COMMANDS = {member.value: member for member in Command}
+
 
 def make_frame(command: Command, id: int, payload: bytes = b'', address: int = 0,
                frame_type: FrameType = FrameType.STANDARD) -> bytes:
@@ -377,7 +380,7 @@ class ReceiveFrame:
         '''
         return self._frame_length
 
-    def consume(self, data: Union[bytes, bytearray]) -> int:  # pylint: disable=too-many-branches,too-many-statements
+    def consume(self, data: Union[bytes, bytearray, memoryview]) -> int:  # pylint: disable=too-many-branches,too-many-statements
         '''
         Consumes data until the frame is complete. Returns the number of consumed bytes. Exceptions raised also carry
         the amount of consumed bytes.
@@ -389,42 +392,76 @@ class ReceiveFrame:
         :raises InvalidCommand: If the command byte is invalid or can't be decoded (such as ``EXTENSION``).
         '''
 
-        i = 0
-        for d_byte in data:  # pylint: disable=too-many-nested-blocks  # ugly parser is ugly
-            self._consumed_bytes += 1
-            i += 1
-            c = bytes([d_byte])  # pylint: disable=invalid-name
-            self._log.debug('read: 0x%s', c.hex())
+        if isinstance(data, memoryview):
+            # normalize so the find() based scanning below is available
+            data = bytes(data)
+        dlen = len(data)
+        debug = self._log.isEnabledFor(logging.DEBUG)
+        escape_byte = ESCAPE_TOKEN[0]
 
-            # sync to start_token
+        i = 0
+        while i < dlen:
+            # sync to start_token, skipping anything before it at C speed
             if len(self._buffer) == 0:
-                self._log.debug('      buffer empty')
-                if c == START_TOKEN:
-                    self._log.debug('      start token found')
-                    self._buffer += c
+                idx = data.find(START_TOKEN, i)
+                if idx == -1:
+                    self._consumed_bytes += dlen - i
+                    return dlen
+                if debug:
+                    self._log.debug('      start token found after %d bytes', idx - i)
+                self._consumed_bytes += idx - i + 1
+                i = idx + 1
+                self._buffer += START_TOKEN
                 continue
 
             if self._escaping:
-                self._log.debug('      resetting escape')
+                if debug:
+                    self._log.debug('      resetting escape')
                 self._escaping = False
+                self._buffer.append(data[i])
+                self._consumed_bytes += 1
+                i += 1
             else:
-                if c == ESCAPE_TOKEN:
-                    self._log.debug('      setting escape')
+                if data[i] == escape_byte:
+                    if debug:
+                        self._log.debug('      setting escape')
                     # set the escape mode and ignore the byte at hand.
                     self._escaping = True
+                    self._consumed_bytes += 1
+                    i += 1
                     continue
 
-            self._buffer += c
-            self._log.debug('      adding to buffer')
+                # Bulk-copy up to the next parser event: the command byte, the end of the header or the end of the
+                # frame, whichever is closest. An escape token cuts the span short and is handled on the next pass.
+                blen = len(self._buffer)
+                if blen < BUFFER_LEN_COMMAND:
+                    need = BUFFER_LEN_COMMAND - blen
+                elif blen < self._frame_header_length:
+                    need = self._frame_header_length - blen
+                elif blen < self._frame_length:
+                    need = self._frame_length - blen
+                else:
+                    # corrupt length field: the advertised frame length ends inside the header. Take a single byte so
+                    # the oversize check below raises FrameLengthExceeded with accurate byte accounting.
+                    need = 1
+                stop = min(i + need, dlen)
+                esc = data.find(ESCAPE_TOKEN, i, stop)
+                end = esc if esc != -1 else stop
+                span = data[i:end]
+                if debug:
+                    self._log.debug('read: 0x%s', span.hex())
+                self._buffer += span
+                self._consumed_bytes += end - i
+                i = end
 
             blen = len(self._buffer)  # cache
 
             if blen == BUFFER_LEN_COMMAND:
-                cmd = struct.unpack('B', bytes([self._buffer[1]]))[0]
+                cmd = self._buffer[1]
                 try:
-                    self._command = Command(cmd)
-                except ValueError as exc:
-                    raise InvalidCommand(str(exc), cmd, i) from exc
+                    self._command = _COMMANDS[cmd]
+                except KeyError:
+                    raise InvalidCommand(f'{cmd} is not a valid Command', cmd, i) from None
 
                 if self._command == Command.EXTENSION:
                     raise InvalidCommand('EXTENSION is not supported', cmd, i)
@@ -467,12 +504,15 @@ class ReceiveFrame:
                 self._log.debug('      buffer: %s', self._buffer.hex())
                 self._complete = True
 
-                self._crc16 = struct.unpack('>H', self._buffer[-2:])[0]
-                calc_crc16 = CRC16(self._buffer[len(START_TOKEN):-FRAME_LENGTH_CRC16])
+                # one view over the buffer serves the received CRC, the checksummed region and the payload without
+                # copying anything but the payload itself
+                view = memoryview(self._buffer)
+                self._crc16 = struct.unpack('>H', view[-FRAME_LENGTH_CRC16:])[0]
+                calc_crc16 = CRC16(view[len(START_TOKEN):-FRAME_LENGTH_CRC16])
                 self._crc_ok = self._crc16 == calc_crc16
                 self._log.debug('      crc: %04x calculated: %04x match: %s', self._crc16, calc_crc16, self._crc_ok)
 
-                self._data = self._buffer[self._frame_header_length:-FRAME_LENGTH_CRC16]
+                self._data = bytes(view[self._frame_header_length:-FRAME_LENGTH_CRC16])
 
                 if not self._crc_ok and not self._ignore_crc_mismatch:
                     raise FrameCRCMismatch('CRC mismatch', self._crc16, calc_crc16, i)
@@ -9,7 +9,10 @@
 Dataset defining the values and names to conveniently use the system.
 '''
 
-from typing import Any, Dict, List, Optional
+import logging
+from bisect import bisect_left
+from sys import intern
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .exceptions import RctClientException
 from .types import ObjectGroup, DataType
@@ -48,6 +51,9 @@ class ObjectInfo:
     :param sim_data: Data used by the simulator.
     :param enum_values: Mapping of integer ID to string value.
     '''
+    __slots__ = ('group', 'object_id', 'index', 'name', 'request_data_type', 'response_data_type', 'description',
+                 'unit', 'enum_map', 'sim_data')
+
     #: The group the ID belongs to
     group: ObjectGroup
     #: The unique message id that identifies it.
@@ -75,7 +81,7 @@ class ObjectInfo:
         self.group = group
         self.object_id = object_id
         self.index = index
-        self.name = name
+        self.name = intern(name)
         self.request_data_type = request_data_type
         self.enum_map = enum_map
         if response_data_type is None:
@@ -84,8 +90,8 @@ class ObjectInfo:
             if request_data_type == DataType.ENUM and response_data_type != DataType.ENUM:
                 raise RctClientException('ENUMs do not support non-ENUM response types')
             self.response_data_type = response_data_type
-        self.description = description
-        self.unit = unit
+        self.description = intern(description) if description is not None else None
+        self.unit = intern(unit) if unit is not None else None
 
         if sim_data is None:
             if self.response_data_type == DataType.BOOL:
@@ -128,19 +134,38 @@ class Registry:
     functions to query for IDs by various means. As it contains the whole lot of IDs, loading it is slow. It should be
     kept around as a singleton.
 
-    :param data: List of the IDs it should maintain.
+    :param data: The IDs it should maintain.
     '''
 
     _ids: Dict[int, ObjectInfo]
+    #: name to ObjectInfo mapping, as names are unique as well
+    _names: Dict[str, ObjectInfo]
+    #: all names in sorted order, for prefix searches
+    _sorted_names: Tuple[str, ...]
+    #: entries grouped by their ObjectGroup
+    _groups: Dict[ObjectGroup, Tuple[ObjectInfo, ...]]
     #: maximum length of names in _ids
     _name_max_len: int
 
-    def __init__(self, data: List[ObjectInfo]) -> None:
+    def __init__(self, data: Iterable[ObjectInfo]) -> None:
         self._ids = dict()
+        self._names = dict()
         self._name_max_len = 0
+        groups: Dict[ObjectGroup, List[ObjectInfo]] = dict()
+        duplicates: List[int] = []
         for elem in data:
             self._name_max_len = max(self._name_max_len, len(elem.name))
+            if elem.object_id in self._ids:
+                duplicates.append(elem.object_id)
             self._ids[elem.object_id] = elem
+            self._names[elem.name] = elem
+            groups.setdefault(elem.group, []).append(elem)
+        if duplicates:
+            # later entries win, which lets corrected entries shadow earlier guesses (names ending in '??')
+            logging.getLogger(__name__).debug('Duplicate object IDs in registry: %s',
+                                              ', '.join(f'0x{oid:X}' for oid in duplicates))
+        self._sorted_names = tuple(sorted(self._names))
+        self._groups = {group: tuple(elems) for group, elems in groups.items()}
 
     def type_by_id(self, id: int) -> DataType:
         '''
@@ -170,14 +195,33 @@ class Registry:
         :returns: The id.
         :raises KeyError: If no id with that `name` is in the registry.
         '''
-        for id, elem in self._ids.items():
-            if elem.name == name:
-                return elem
-        raise KeyError('Element not found')
+        try:
+            return self._names[name]
+        except KeyError:
+            raise KeyError('Element not found') from None
 
     def all(self) -> List[ObjectInfo]:
         return list(self._ids.values())
 
+    def get_by_prefix(self, prefix: str) -> List[ObjectInfo]:
+        '''
+        Returns all entries whose name starts with the given `prefix`, ordered by name. Useful for querying a dotted
+        namespace such as ``battery.`` in one go.
+
+        :param prefix: Prefix to match against the names.
+        :returns: The matching entries, or an empty list if none match.
+        '''
+        return [self._names[name] for name in self.prefix_complete_name(prefix)]
+
+    def get_by_group(self, group: ObjectGroup) -> List[ObjectInfo]:
+        '''
+        Returns all entries belonging to the given group, in the order they are defined in the source table.
+
+        :param group: The group to query for.
+        :returns: The entries of the group, or an empty list if it has none.
+        '''
+        return list(self._groups.get(group, ()))
+
     def prefix_complete_name(self, prefix: str) -> List[str]:
         '''
         To aid the CLI commands when autocompleting, this function returns a list of names that start with the given
@@ -187,9 +231,14 @@ class Registry:
         :returns: A list of names that start with the given prefix, or all if the prefix is an empty string.
         '''
         if len(prefix) == 0:
-            return sorted([x.name for x in self._ids.values()])
-        else:
-            return sorted([x.name for x in self._ids.values() if x.name.startswith(prefix)])
+            return list(self._sorted_names)
+        # as the names are kept sorted, all matches form a contiguous run starting at the insertion point
+        idx = bisect_left(self._sorted_names, prefix)
+        result = []
+        while idx < len(self._sorted_names) and self._sorted_names[idx].startswith(prefix):
+            result.append(self._sorted_names[idx])
+            idx += 1
+        return result
 
     def name_max_length(self) -> int:
         '''
@@ -198,8 +247,14 @@ class Registry:
         return self._name_max_len
 
 
+#: I/O usage mapping, shared by the entries for both I/O ports
+_ENUM_IO_USAGE = {0: 'I/O not used', 1: 'Input S0 grid power consumption', 2: 'Input S0 grid power feed-in',
+                  3: 'Input S0 household power', 4: 'Output S0 inverter power', 5: 'Input level switch',
+                  6: 'Input emergency turn off', 7: 'Output S0 grid power feed-in', 8: 'Output S0 household power',
+                  9: 'Output S0 solar power', 10: 'Input S0 external power'}
+
 #: Registry singleton containing all known IDs
-REGISTRY = Registry([
+REGISTRY = Registry((
     ObjectInfo(group=ObjectGroup.RB485,           object_id=0x104EB6A,  index=0,   request_data_type=DataType.FLOAT,  unit='Hz',          name='rb485.f_grid[2]',                              description='Grid phase 3 frequency'),
     ObjectInfo(group=ObjectGroup.RB485,           object_id=0x7367B64,  index=24,  request_data_type=DataType.INT16,                      name='rb485.phase_marker',                           description='Next phase after phase 1 in Power Switch'),
     ObjectInfo(group=ObjectGroup.RB485,           object_id=0x173D81E4, index=82,  request_data_type=DataType.UINT32,                     name='rb485.version_boot',                           description='Power Switch bootloader version'),
@@ -720,8 +775,7 @@ REGISTRY = Registry([
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x3C705F61, index=208, request_data_type=DataType.FLOAT,                      name='io_board.rse_table[8]',                        description='K4..K1: 1000'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x3DBCC6B4, index=213, request_data_type=DataType.FLOAT,                      name='io_board.rse_table[6]',                        description='K4..K1: 0110'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x4F330E08, index=275, request_data_type=DataType.ENUM,                       name='io_board.io2_usage',                           description='Digital I/O 2 usage',
-               enum_map={0: 'I/O not used', 1: 'Input S0 grid power consumption', 2: 'Input S0 grid power feed-in', 3: 'Input S0 household power', 4: 'Output S0 inverter power', 5: 'Input level switch', 6: 'Input emergency turn off',
-                         7: 'Output S0 grid power feed-in', 8: 'Output S0 household power', 9: 'Output S0 solar power', 10: 'Input S0 external power'}),
+               enum_map=_ENUM_IO_USAGE),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x54DBC202, index=296, request_data_type=DataType.FLOAT,                      name='io_board.rse_table[12]',                       description='K4..K1: 1100'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x5867B3BE, index=307, request_data_type=DataType.FLOAT,                      name='io_board.rse_table[2]',                        description='K4..K1: 0010'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x58C1A946, index=308, request_data_type=DataType.UINT8,                      name='io_board.check_state'),
@@ -741,8 +795,7 @@ REGISTRY = Registry([
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x88C9707B, index=487, request_data_type=DataType.FLOAT,                      name='io_board.rse_table[15]',                       description='K4..K1: 1111'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x88F36D45, index=490, request_data_type=DataType.UINT8,                      name='io_board.rse_data',                            description='Actual K4..K1 data'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x90F123FA, index=522, request_data_type=DataType.ENUM,                       name='io_board.io1_usage',                           description='Digital I/O 1 usage',
-               enum_map={0: 'I/O not used', 1: 'Input S0 grid power consumption', 2: 'Input S0 grid power feed-in', 3: 'Input S0 household power', 4: 'Output S0 inverter power', 5: 'Input level switch', 6: 'Input emergency turn off',
-                         7: 'Output S0 grid power feed-in', 8: 'Output S0 household power', 9: 'Output S0 solar power', 10: 'Input S0 external power'}),
+               enum_map=_ENUM_IO_USAGE),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x98ACC1B8, index=557, request_data_type=DataType.FLOAT,                      name='io_board.rse_table[4]',                        description='K4..K1: 0100'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0x9B92023F, index=566, request_data_type=DataType.FLOAT,                      name='io_board.rse_table[7]',                        description='K4..K1: 0111'),
     ObjectInfo(group=ObjectGroup.IO_BOARD,        object_id=0xA3393749, index=582, request_data_type=DataType.UINT8,                      name='io_board.check_start'),
@@ -1161,4 +1214,4 @@ REGISTRY = Registry([
     # Object that are known to exist but have not been documented yet (e.g. object_id missing)
     # ObjectInfo(group=ObjectGroup.OTHERS,              object_id=0x0,        index=998, request_data_type=DataType.UINT8,                  name='inv_struct.dsd_select_i_fix'),
     # ObjectInfo(group=ObjectGroup.OTHERS,              object_id=0x0,        index=999, request_data_type=DataType.UINT8,                  name='inv_struct.dsd_select_strobe_fix'),
-])
+))
@@ -4,16 +4,20 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import logging
-import select
 import socket
 import threading
+from typing import Dict
 
 from .exceptions import FrameCRCMismatch
 from .frame import ReceiveFrame, SendFrame
-from .registry import REGISTRY as R
+from .registry import ObjectInfo, REGISTRY as R
 from .types import Command
 from .utils import decode_value, encode_value
 
+#: Response frames for READ requests, keyed by object ID. As the simulated data never changes, the encoded frames are
+#: cached on first use instead of being rebuilt (including the CRC) for every request.
+_read_responses: Dict[int, bytes] = {}
+
 
 def run_simulator(host: str, port: int, verbose: bool) -> None:
     '''
@@ -33,23 +37,18 @@ def run_simulator(host: str, port: int, verbose: bool) -> None:
         raise
 
     log.info('Waiting for client connections')
+    level = logging.INFO if verbose else logging.DEBUG
     try:
         while True:
             connection, address = serversocket.accept()
-            msg = f'connection accepted: {connection} {address}'
-            if verbose:
-                log.info(msg)
-            else:
-                log.debug(msg)
+            # responses are tiny, send them out immediately instead of letting Nagle's algorithm buffer them
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            log.log(level, 'connection accepted: %s %s', connection, address)
 
             # Start a new thread and return its identifier
             threading.Thread(target=socket_thread, args=(connection, address), daemon=True).start()
     except KeyboardInterrupt:
-        msg = 'Keyboard interrupt, shutting down'
-        if verbose:
-            log.info(msg)
-        else:
-            log.debug(msg)
+        log.log(level, 'Keyboard interrupt, shutting down')
 
     serversocket.close()
 
@@ -57,56 +56,73 @@ def run_simulator(host: str, port: int, verbose: bool) -> None:
 def socket_thread(connection, address) -> None:
     log = logging.getLogger(f'rctclient.simulator.socket_thread.{address[1]}')
     frame = ReceiveFrame()
+    connection.settimeout(1000.0)
     while True:
         try:
-            ready_read, _, _ = select.select([connection], [], [], 1000.0)
-        except select.error as e:
-            log.error(f'Error during select call: {str(e)}')
-            break
-
-        if ready_read:
             # read up to 4k bytes in one chunk
             buf = connection.recv(4096)
-            if len(buf) > 0:
-                log.debug(f'Read {len(buf)} bytes: {buf.hex()}')
-                consumed = 0
-                while consumed < len(buf):
-                    try:
-                        i = frame.consume(buf)
-                    except FrameCRCMismatch as exc:
-                        log.warning(f'Discard frame with wrong CRC checksum. Got 0x{exc.received_crc:x}, calculated '
-                                    f'0x{exc.calculated_crc:x}, consumed {exc.consumed_bytes} bytes')
-                        log.warning(f'Frame data: {frame.data.hex()}')
-                        consumed += exc.consumed_bytes
-                        frame = ReceiveFrame()
-                    else:
-                        log.debug(f'Frame consumed {i} bytes')
-                        consumed += i
-                        if frame.complete():
-                            log.debug(f'Complete frame: {frame}')
-                            try:
-                                send_sim_response(connection, frame, log)
-                            except Exception as exc:
-                                log.warning(f'Caught {type(exc)} during send_sim_response: {str(exc)}')
-
-                            frame = ReceiveFrame()
-                    buf = buf[consumed:]
+        except socket.timeout:
+            continue
+        except socket.error as e:
+            log.error(f'Error during receive: {str(e)}')
+            break
+
+        if len(buf) == 0:
+            break
+
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug(f'Read {len(buf)} bytes: {buf.hex()}')
+        view = memoryview(buf)
+        pos = 0
+        while pos < len(buf):
+            try:
+                i = frame.consume(view[pos:])
+            except FrameCRCMismatch as exc:
+                log.warning(f'Discard frame with wrong CRC checksum. Got 0x{exc.received_crc:x}, calculated '
+                            f'0x{exc.calculated_crc:x}, consumed {exc.consumed_bytes} bytes')
+                log.warning(f'Frame data: {frame.data.hex()}')
+                pos += exc.consumed_bytes
+                frame = ReceiveFrame()
             else:
-                break
+                pos += i
+                if debug:
+                    log.debug(f'Frame consumed {i} bytes')
+                if frame.complete():
+                    if debug:
+                        log.debug(f'Complete frame: {frame}')
+                    try:
+                        send_sim_response(connection, frame, log)
+                    except Exception as exc:
+                        log.warning(f'Caught {type(exc)} during send_sim_response: {str(exc)}')
+
+                    frame = ReceiveFrame()
 
     connection.close()
     log.debug(f'Closing connection {connection}')
 
 
+def _read_response(oinfo: ObjectInfo) -> bytes:
+    '''
+    Returns the encoded response frame for a READ request, building and caching it on first use.
+    '''
+    try:
+        return _read_responses[oinfo.object_id]
+    except KeyError:
+        payload = encode_value(oinfo.response_data_type, oinfo.sim_data)
+        data = SendFrame(command=Command.RESPONSE, id=oinfo.object_id, payload=payload).data
+        _read_responses[oinfo.object_id] = data
+        return data
+
+
 def send_sim_response(connection, frame: ReceiveFrame, log: logging.Logger) -> None:
     oinfo = R.get_by_id(frame.id)
 
     if frame.command == Command.READ:
-        payload = encode_value(oinfo.response_data_type, oinfo.sim_data)
-        sframe = SendFrame(command=Command.RESPONSE, id=frame.id, address=frame.address, payload=payload)
-        log.info(f'Read   : 0x{oinfo.object_id:08X} {oinfo.name:{R.name_max_length()}} -> {sframe.data.hex()}')
-        log.debug(f'Sending frame {sframe} with {len(sframe.data)} bytes 0x{sframe.data.hex()}')
-        connection.send(sframe.data)
+        data = _read_response(oinfo)
+        if log.isEnabledFor(logging.INFO):
+            log.info(f'Read   : 0x{oinfo.object_id:08X} {oinfo.name:{R.name_max_length()}} -> {data.hex()}')
+        connection.sendall(data)
 
     elif frame.command == Command.WRITE:
         value = decode_value(oinfo.request_data_type, frame.data)
@@ -71,8 +71,7 @@ class Command(IntEnum):
         '''
         Returns whether a command is a long command.
         '''
-        return command in (Command.LONG_WRITE, Command.LONG_RESPONSE, Command.PLANT_LONG_WRITE,
-                           Command.PLANT_LONG_RESPONSE)
+        return command in _LONG_COMMANDS
 
     @staticmethod
     def is_write(command: 'Command') -> bool:
@@ -81,7 +80,7 @@ class Command(IntEnum):
 
         .. versionadded:: 0.0.4
         '''
-        return command in (Command.WRITE, Command.LONG_WRITE, Command.PLANT_WRITE, Command.PLANT_LONG_WRITE)
+        return command in _WRITE_COMMANDS
 
     @staticmethod
     def is_response(command: 'Command') -> bool:
@@ -90,8 +89,16 @@ class Command(IntEnum):
 
         .. versionadded:: 0.0.4
         '''
-        return command in (Command.RESPONSE, Command.LONG_RESPONSE, Command.PLANT_RESPONSE,
-                           Command.PLANT_LONG_RESPONSE)
+        return command in _RESPONSE_COMMANDS
+
+
+# pre-resolved member sets backing the classification helpers above, so each call is a single hash probe instead of
+# constructing a tuple of members
+_LONG_COMMANDS = frozenset((Command.LONG_WRITE, Command.LONG_RESPONSE, Command.PLANT_LONG_WRITE,
+                            Command.PLANT_LONG_RESPONSE))
+_WRITE_COMMANDS = frozenset((Command.WRITE, Command.LONG_WRITE, Command.PLANT_WRITE, Command.PLANT_LONG_WRITE))
+_RESPONSE_COMMANDS = frozenset((Command.RESPONSE, Command.LONG_RESPONSE, Command.PLANT_RESPONSE,
+                                Command.PLANT_LONG_RESPONSE))
 
 
 class ObjectGroup(IntEnum):
@@ -216,6 +223,8 @@ class EventEntry:
     :param element3: The third element of the entry.
     :param element4: The fourth element of the entry.
     '''
+    __slots__ = ('entry_type', 'timestamp', 'element2', 'element3', 'element4')
+
     entry_type: int
     timestamp: datetime
     element2: Optional[bytes]
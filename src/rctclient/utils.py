@@ -3,9 +3,10 @@
 # Copyright 2020-2021, Stefan Valouch (svalouch)
 # SPDX-License-Identifier: GPL-3.0-only
 
+import binascii
 import struct
 from datetime import datetime
-from typing import overload, Dict, Tuple, Union
+from typing import overload, Any, Callable, Dict, Tuple, Union
 
 try:
     # Python 3.8+
@@ -16,29 +17,31 @@ except ImportError:
 
 from .types import DataType, EventEntry
 
+# precompiled structures for the native types, shared by the encoding and decoding machinery
+_STRUCT_UINT8 = struct.Struct('>B')
+_STRUCT_INT8 = struct.Struct('>b')
+_STRUCT_UINT16 = struct.Struct('>H')
+_STRUCT_INT16 = struct.Struct('>h')
+_STRUCT_UINT32 = struct.Struct('>I')
+_STRUCT_INT32 = struct.Struct('>i')
+_STRUCT_FLOAT = struct.Struct('>f')
+# composite records: a timeseries (timestamp, value) pair and an event table entry
+_STRUCT_TS_PAIR = struct.Struct('>If')
+_STRUCT_EVENT_ENTRY = struct.Struct('>IIIII')
+
 
 # pylint: disable=invalid-name
-def CRC16(data: Union[bytes, bytearray]) -> int:
+def CRC16(data: Union[bytes, bytearray, memoryview]) -> int:
     '''
     Calculates the CRC16 checksum of data. Note that this automatically skips the first byte (start token) if the
     length is uneven.
-    '''
-    crcsum = 0xFFFF
-    polynom = 0x1021  # CCITT Polynom
-    buffer = bytearray(data)
 
-    # skip start token
+    The protocol uses the CCITT polynom (0x1021) with an initial value of 0xFFFF, padding uneven input with a zero
+    byte. This matches ``binascii.crc_hqx``, so the computation is done in C instead of a Python bit loop.
+    '''
     if len(data) & 0x01:
-        buffer.append(0)
-
-    for byte in buffer:
-        crcsum ^= byte << 8
-        for _bit in range(8):
-            crcsum <<= 1
-            if crcsum & 0x7FFF0000:
-                # ~~ overflow in bit 16
-                crcsum = (crcsum & 0x0000FFFF) ^ polynom
-    return crcsum
+        data = bytes(data) + b'\x00'
+    return binascii.crc_hqx(data, 0xFFFF)
 
 
 @overload
@@ -63,7 +66,6 @@ def encode_value(data_type: Literal[DataType.STRING], value: Union[str, bytes])
     ...
 
 
-# pylint: disable=too-many-branches,too-many-return-statements
 def encode_value(data_type: DataType, value: Union[bool, bytes, float, int, str]) -> bytes:
     '''
     Encodes a value suitable for transmitting as payload to the device. The actual encoding depends on the `data_type`.
@@ -74,33 +76,22 @@ def encode_value(data_type: DataType, value: Union[bool, bytes, float, int, str]
     :raises struct.error: If the packing failed, usually when the input value can't be encoded using the selected type.
     :raises ValueError: For string values, if the data type is not ``str`` or ``bytes``.
     '''
-    if data_type == DataType.BOOL:
-        return struct.pack('>B', bool(value))
-    if data_type in (DataType.UINT8, DataType.ENUM):
-        value = struct.unpack('<B', struct.pack('<b', value))[0]
-        return struct.pack(">B", value)
-    if data_type == DataType.INT8:
-        return struct.pack(">b", value)
-    if data_type == DataType.UINT16:
-        value = struct.unpack('<H', struct.pack('<h', value))[0]
-        return struct.pack(">H", value)
-    if data_type == DataType.INT16:
-        return struct.pack(">h", value)
-    if data_type == DataType.UINT32:
-        value = struct.unpack('<I', struct.pack('<i', value))[0]
-        return struct.pack(">I", value)
-    if data_type == DataType.INT32:
-        return struct.pack(">i", value)
-    if data_type == DataType.FLOAT:
-        return struct.pack(">f", value)
-    if data_type == DataType.STRING:
-        if isinstance(value, str):
-            return value.encode('utf-8')
-        if isinstance(value, bytes):
-            return value
-        raise ValueError(f'Invalid value of type {type(value)} for string type encoding')
-        # return struct.pack("s", value)
-    raise KeyError('Undefinded or unknown type')
+    try:
+        encoder = _ENCODERS[data_type]
+    except KeyError:
+        raise KeyError('Undefinded or unknown type') from None
+    return encoder(value)
+
+
+def _encode_string(value: Union[str, bytes]) -> bytes:
+    '''
+    Helper function to encode the string type.
+    '''
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    if isinstance(value, bytes):
+        return value
+    raise ValueError(f'Invalid value of type {type(value)} for string type encoding')
 
 
 @overload
@@ -135,7 +126,6 @@ def decode_value(data_type: Literal[DataType.EVENT_TABLE], data: bytes) -> Tuple
     ...
 
 
-# pylint: disable=too-many-branches,too-many-return-statements
 def decode_value(data_type: DataType, data: bytes) -> Union[bool, bytes, float, int, str,
                                                             Tuple[datetime, Dict[datetime, int]],
                                                             Tuple[datetime, Dict[datetime, EventEntry]]]:
@@ -152,49 +142,30 @@ def decode_value(data_type: DataType, data: bytes) -> Union[bool, bytes, float,
     :return: The decoded value, depending on the `data_type`.
     :raises struct.error: If decoding of native types failed.
     '''
-    if data_type == DataType.BOOL:
-        value = struct.unpack(">B", data)[0]
-        if value != 0:
-            return True
-        return False
-    if data_type in (DataType.UINT8, DataType.ENUM):
-        return struct.unpack(">B", data)[0]
-    if data_type == DataType.INT8:
-        return struct.unpack(">b", data)[0]
-    if data_type == DataType.UINT16:
-        return struct.unpack(">H", data)[0]
-    if data_type == DataType.INT16:
-        return struct.unpack(">h", data)[0]
-    if data_type == DataType.UINT32:
-        return struct.unpack(">I", data)[0]
-    if data_type == DataType.INT32:
-        return struct.unpack(">i", data)[0]
-    if data_type == DataType.FLOAT:
-        return struct.unpack(">f", data)[0]
-    if data_type == DataType.STRING:
-        pos = data.find(0x00)
-        if pos == -1:
-            return data.decode('ascii')
-        return data[0:pos].decode('ascii')
-    if data_type == DataType.TIMESERIES:
-        return _decode_timeseries(data)
-    if data_type == DataType.EVENT_TABLE:
-        return _decode_event_table(data)
-    raise KeyError(f'Undefined or unknown type {data_type}')
+    try:
+        decoder = _DECODERS[data_type]
+    except KeyError:
+        raise KeyError(f'Undefined or unknown type {data_type}') from None
+    return decoder(data)
+
+
+def _decode_string(data: bytes) -> str:
+    '''
+    Helper function to decode the string type, which may be padded with `\\0`.
+    '''
+    return data.split(b'\x00', 1)[0].decode('ascii')
 
 
 def _decode_timeseries(data: bytes) -> Tuple[datetime, Dict[datetime, int]]:
     '''
     Helper function to decode the timeseries type.
     '''
-    timestamp = datetime.fromtimestamp(struct.unpack('>I', data[0:4])[0])
-    tsval: Dict[datetime, int] = dict()
     assert len(data) % 4 == 0, 'Data should be divisible by 4'
     assert int(len(data) / 4 % 2) == 1, 'Data should be an even number of 4-byte pairs plus the starting timestamp'
-    for pair in range(0, int(len(data) / 4 - 1), 2):
-        pair_ts = datetime.fromtimestamp(struct.unpack('>I', data[4 + pair * 4:4 + pair * 4 + 4])[0])
-        pair_val = struct.unpack('>f', data[4 + pair * 4 + 4:4 + pair * 4 + 4 + 4])[0]
-        tsval[pair_ts] = pair_val
+    timestamp = datetime.fromtimestamp(_STRUCT_UINT32.unpack_from(data)[0])
+    fromtimestamp = datetime.fromtimestamp
+    tsval: Dict[datetime, int] = {fromtimestamp(pair_ts): pair_val
+                                  for pair_ts, pair_val in _STRUCT_TS_PAIR.iter_unpack(memoryview(data)[4:])}
     return timestamp, tsval
 
 
@@ -202,20 +173,16 @@ def _decode_event_table(data: bytes) -> Tuple[datetime, Dict[datetime, EventEntr
     '''
     Helper function to decode the event table type.
     '''
-    timestamp = datetime.fromtimestamp(struct.unpack('>I', data[0:4])[0])
-    tabval: Dict[datetime, EventEntry] = dict()
     assert len(data) % 4 == 0
     assert (len(data) - 4) % 20 == 0
-    for pair in range(0, int(len(data) / 4 - 1), 5):
-        # this is most likely a single byte of information, but this is not sure yet
-        # entry_type = bytes([struct.unpack('>I', data[4 + pair * 4:4 + pair * 4 + 4])[0]]).decode('ascii')
-        entry_type = struct.unpack('>I', data[4 + pair * 4:4 + pair * 4 + 4])[0]
-        timestamp = datetime.fromtimestamp(struct.unpack('>I', data[4 + pair * 4 + 4:4 + pair * 4 + 8])[0])
-        element2 = struct.unpack('>I', data[4 + pair * 4 + 8:4 + pair * 4 + 12])[0]
-        element3 = struct.unpack('>I', data[4 + pair * 4 + 12:4 + pair * 4 + 16])[0]
-        element4 = struct.unpack('>I', data[4 + pair * 4 + 16:4 + pair * 4 + 20])[0]
-        tabval[timestamp] = EventEntry(entry_type=entry_type, timestamp=timestamp, element2=element2, element3=element3,
-                                       element4=element4)
+    timestamp = datetime.fromtimestamp(struct.unpack('>I', data[0:4])[0])
+    tabval: Dict[datetime, EventEntry] = dict()
+    fromtimestamp = datetime.fromtimestamp
+    # the first field is most likely a single byte of information, but this is not sure yet
+    for entry_type, entry_ts, element2, element3, element4 in _STRUCT_EVENT_ENTRY.iter_unpack(memoryview(data)[4:]):
+        entry_timestamp = fromtimestamp(entry_ts)
+        tabval[entry_timestamp] = EventEntry(entry_type=entry_type, timestamp=entry_timestamp, element2=element2,
+                                             element3=element3, element4=element4)
         # these two are known to contain object IDs
         # if entry_type in ['s', 'w']:
         #     object_id = struct.unpack('>I', data[4 + pair * 4 + 8:4 + pair * 4 + 12])[0]
@@ -231,3 +198,36 @@ def _decode_event_table(data: bytes) -> Tuple[datetime, Dict[datetime, EventEntr
         #     tabval[timestamp] = EventEntry(timestamp=timestamp, object_id=object_id, entry_type=entry_type,
         #                                    timestamp_end=timestamp_end)
     return timestamp, tabval
+
+
+#: Encoder callable per data type, the counterpart to the decoder table below. The unsigned integer types mask the
+#: input to the field width so that negative values encode as their two's complement representation.
+_ENCODERS: Dict[DataType, Callable[[Any], bytes]] = {
+    DataType.BOOL: lambda value: _STRUCT_UINT8.pack(bool(value)),
+    DataType.UINT8: lambda value: _STRUCT_UINT8.pack(value & 0xFF),
+    DataType.INT8: lambda value: _STRUCT_INT8.pack(value),
+    DataType.UINT16: lambda value: _STRUCT_UINT16.pack(value & 0xFFFF),
+    DataType.INT16: lambda value: _STRUCT_INT16.pack(value),
+    DataType.UINT32: lambda value: _STRUCT_UINT32.pack(value & 0xFFFFFFFF),
+    DataType.INT32: lambda value: _STRUCT_INT32.pack(value),
+    DataType.ENUM: lambda value: _STRUCT_UINT8.pack(value & 0xFF),
+    DataType.FLOAT: lambda value: _STRUCT_FLOAT.pack(value),
+    DataType.STRING: _encode_string,
+}
+
+#: Decoder callable per data type, bound to precompiled structures. Built once at import so that
+#: :func:`decode_value` is a single dictionary lookup instead of a chain of comparisons.
+_DECODERS: Dict[DataType, Callable[[bytes], Any]] = {
+    DataType.BOOL: lambda data: _STRUCT_UINT8.unpack(data)[0] != 0,
+    DataType.UINT8: lambda data: _STRUCT_UINT8.unpack(data)[0],
+    DataType.INT8: lambda data: _STRUCT_INT8.unpack(data)[0],
+    DataType.UINT16: lambda data: _STRUCT_UINT16.unpack(data)[0],
+    DataType.INT16: lambda data: _STRUCT_INT16.unpack(data)[0],
+    DataType.UINT32: lambda data: _STRUCT_UINT32.unpack(data)[0],
+    DataType.INT32: lambda data: _STRUCT_INT32.unpack(data)[0],
+    DataType.ENUM: lambda data: _STRUCT_UINT8.unpack(data)[0],
+    DataType.FLOAT: lambda data: _STRUCT_FLOAT.unpack(data)[0],
+    DataType.STRING: _decode_string,
+    DataType.TIMESERIES: _decode_timeseries,
+    DataType.EVENT_TABLE: _decode_event_table,
+}
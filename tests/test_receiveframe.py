@@ -4,6 +4,7 @@ Tests the ReceiveFrame class.
 '''
 
 import pytest
+from rctclient.exceptions import FrameLengthExceeded
 from rctclient.frame import ReceiveFrame
 from rctclient.types import Command
 
@@ -71,3 +72,25 @@ class TestReceiveFrame:
         assert frame.address == 0, 'Standard frames have no address'
         assert frame.data == bytearray.fromhex('505320362e30204241334c000000000000000000000000000000000000000000000000'
                                                '0000000000000000000000000000000000000000000000000000000000')
+
+    def test_corrupt_length_field(self) -> None:
+        '''
+        Tests that a length field that ends inside the header (here: 0 for a READ command) raises FrameLengthExceeded
+        with a correct consumed-bytes count instead of the parser overshooting.
+        '''
+        data = bytearray.fromhex('2b01004141414141')
+        frame = ReceiveFrame()
+        with pytest.raises(FrameLengthExceeded) as excinfo:
+            frame.consume(data)
+        assert excinfo.value.consumed_bytes == len(data)
+
+    def test_corrupt_length_field_chunked(self) -> None:
+        '''
+        Tests the corrupt length field when the frame is split across consume() calls, as happens with data arriving
+        over a socket.
+        '''
+        frame = ReceiveFrame()
+        assert frame.consume(bytearray.fromhex('2b010041414141')) == 7, 'The frame should consume the entire header'
+        with pytest.raises(FrameLengthExceeded) as excinfo:
+            frame.consume(b'A')
+        assert excinfo.value.consumed_bytes == 1
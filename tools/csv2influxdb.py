@@ -65,20 +65,23 @@ def csv2influxdb(input: str, device_name: str, influx_host: str, influx_port: in
         click.echo(f'InfluxDB refused connection: {str(exc)}')
         sys.exit(2)
 
+    # measurement and tags are identical for every point, build them once
+    measurement = f'history_{resolution}'
+    tags = {'rct': device_name}
+
     points = []
     for row in reader:
         points.append({
-            'measurement': f'history_{resolution}',
-            'tags': {
-                'rct': device_name,
-            },
+            'measurement': measurement,
+            'tags': tags,
             'time': row.pop('timestamp'),
             'fields': {k: float(v) for k, v in row.items()},
         })
 
     if points:
         click.echo(f'Writing {len(points)} points')
-        influx.write_points(time_precision='s', points=points)
+        # chunk the upload so a year of minute-resolution data does not end up in one giant request
+        influx.write_points(time_precision='s', points=points, batch_size=10000)
 
     if input != '-':
         fin.close()
@@ -13,7 +13,7 @@ import struct
 import sys
 from datetime import datetime
 from scapy.utils import rdpcap  # type: ignore
-from scapy.layers.inet import TCP  # type: ignore
+from scapy.layers.inet import IP, TCP  # type: ignore
 from rctclient.exceptions import RctClientException, FrameCRCMismatch, InvalidCommand
 from rctclient.frame import ReceiveFrame
 from rctclient.registry import REGISTRY as R
@@ -25,29 +25,31 @@ def main():
     ''' Main program '''
     packets = rdpcap(sys.argv[1])
 
+    # demultiplex the packets into per-flow streams in a single pass, instead of paying for packets.sessions()
     streams = dict()
-
-    i = 0
-    for name, stream in packets.sessions().items():
-        print(f'Stream {i:4} {name} {stream} ', end='')
-        length = 0
-        streams[i] = dict()
-        for k in stream:
-            if TCP in k:
-                if len(k[TCP].payload) > 0:
-                    if k[TCP].sport == 8899 or k[TCP].dport == 8899:
-                        payload = bytes(k[TCP].payload)
-
-                        # skip AT+ keepalive and app serial "protocol switch" '2b3ce1'
-                        if payload in [b'AT+\r', b'+<\xe1']:
-                            continue
-                        ptime = float(k.time)
-                        if ptime not in streams[i]:
-                            streams[i][ptime] = b''
-                        streams[i][ptime] += payload
-                        length += len(payload)
-        print(f'{length} bytes')
-        i += 1
+    stream_index = dict()
+    lengths = dict()
+    for k in packets:
+        if IP not in k or TCP not in k or len(k[TCP].payload) == 0:
+            continue
+        if k[TCP].sport != 8899 and k[TCP].dport != 8899:
+            continue
+        payload = bytes(k[TCP].payload)
+
+        # skip AT+ keepalive and app serial "protocol switch" '2b3ce1'
+        if payload in [b'AT+\r', b'+<\xe1']:
+            continue
+        flow = (k[IP].src, k[TCP].sport, k[IP].dst, k[TCP].dport)
+        i = stream_index.setdefault(flow, len(stream_index))
+        stream = streams.setdefault(i, dict())
+        ptime = float(k.time)
+        if ptime not in stream:
+            stream[ptime] = bytearray()
+        stream[ptime] += payload
+        lengths[i] = lengths.get(i, 0) + len(payload)
+
+    for flow, i in stream_index.items():
+        print(f'Stream {i:4} TCP {flow[0]}:{flow[1]} > {flow[2]}:{flow[3]} {lengths[i]} bytes')
 
     frame = None
     sid = 0
@@ -67,11 +69,13 @@ def main():
                 print(f'command: {frame.command}, length: {frame.frame_length}, oid: 0x{frame.id:X}')
                 frame = None
 
-            while len(data_item) > 0:
+            view = memoryview(data_item)
+            pos = 0
+            while pos < len(data_item):
                 if not frame:
                     frame = ReceiveFrame()
                 try:
-                    i = frame.consume(data_item)
+                    i = frame.consume(view[pos:])
                 except InvalidCommand as exc:
                     if frame.command == Command.EXTENSION:
                         print('Frame is an extension frame and we don\'t know how to parse it')
@@ -87,8 +91,8 @@ def main():
                     i = 2
                     frame = ReceiveFrame()
 
-                data_item = data_item[i:]
-                print(f'frame consumed {i} bytes, {len(data_item)} remaining')
+                pos += i
+                print(f'frame consumed {i} bytes, {len(data_item) - pos} remaining')
                 if frame.complete():
                     if frame.id == 0:
                         print(f'Frame complete: {frame} Buffer: {frame._buffer.hex()}')
@@ -14,11 +14,12 @@ import socket
 import struct
 import sys
 from datetime import datetime, timedelta
+from io import StringIO
+from zoneinfo import ZoneInfo
 from tempfile import mkstemp
 from typing import Dict, Optional
 
 import click
-import pytz
 from dateutil.relativedelta import relativedelta
 
 from rctclient.exceptions import FrameCRCMismatch
@@ -113,7 +114,7 @@ def timeseries2csv(host: str, port: int, output: Optional[str], header_format: b
         cprint('Error: --count must be a positive integer')
         sys.exit(1)
 
-    timezone = pytz.timezone(time_zone)
+    timezone = ZoneInfo(time_zone)
     now = datetime.now()
 
     if resolution == 'minutes':
@@ -187,7 +188,9 @@ def timeseries2csv(host: str, port: int, output: Optional[str], header_format: b
         cprint('DAYS_BEFORE_TODAY must be less than a year ago')
         sys.exit(1)
 
-    oids = [x for x in R.all() if x.name in oid_names]
+    oids = [R.get_by_name(name) for name in oid_names]
+    # short column names, derived from the object names once for both querying and the CSV header
+    names = [oid.name.replace(name_prefix, '').replace('_log_ts', '') for oid in oids]
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
@@ -196,10 +199,26 @@ def timeseries2csv(host: str, port: int, output: Optional[str], header_format: b
         cprint('Device refused connection')
         sys.exit(2)
 
+    # the request frames are tiny, get them on the wire immediately
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    # receive buffer, reused across all requests
+    recv_buf = bytearray(4096)
+
     datetable: Dict[datetime, Dict[str, int]] = {dt: dict() for dt in datetime_range(ts_start, ts_end, timediff)}
 
-    for oid in oids:
-        name = oid.name.replace(name_prefix, '').replace('_log_ts', '')
+    # Samples rarely sit exactly on the raster. Map every acceptable truncated timestamp to its raster slot up front,
+    # so fitting a sample is a single dict probe. For "minutes", a sample may be up to one minute before its slot; for
+    # "day" and "month" the hour is disregarded entirely, as before. "year" has no raster correction.
+    raster_fit: Dict[datetime, datetime] = {}
+    if resolution == 'minutes':
+        raster_fit = {slot: slot for slot in datetable}
+        for slot in datetable:
+            raster_fit.setdefault(slot - timedelta(minutes=1), slot)
+    elif resolution in ['day', 'month']:
+        raster_fit = {slot: slot for slot in datetable}
+
+    for oid, name in zip(oids, names):
         cprint(f'Requesting {name}')
 
         # set to true if the current time series reached its end, e.g. year 2000 for "year" resolution
@@ -208,8 +227,8 @@ def timeseries2csv(host: str, port: int, output: Optional[str], header_format: b
 
         while highest_ts > ts_start and not iter_end:
             cprint(f'\ttimestamp: {highest_ts}')
-            sock.send(make_frame(command=Command.WRITE, id=oid.object_id,
-                                 payload=encode_value(DataType.INT32, int(highest_ts.timestamp()))))
+            sock.sendall(make_frame(command=Command.WRITE, id=oid.object_id,
+                                    payload=encode_value(DataType.INT32, int(highest_ts.timestamp()))))
 
             rframe = ReceiveFrame()
             while True:
@@ -220,10 +239,10 @@ def timeseries2csv(host: str, port: int, output: Optional[str], header_format: b
                     raise
 
                 if rread:
-                    buf = sock.recv(1024)
-                    if len(buf) > 0:
+                    length = sock.recv_into(recv_buf)
+                    if length > 0:
                         try:
-                            rframe.consume(buf)
+                            rframe.consume(memoryview(recv_buf)[:length])
                         except FrameCRCMismatch:
                             cprint('\tCRC error')
                             break
@@ -267,23 +286,13 @@ def timeseries2csv(host: str, port: int, output: Optional[str], header_format: b
                 # Check if the timestamp fits the raster, adjust depending on the resolution
                 if t_ts not in datetable:
                     if resolution == 'minutes':
-                        # correct up to one full minute
-                        nt_ts = t_ts.replace(second=0)
-                        if nt_ts not in datetable:
-                            nt_ts = t_ts.replace(second=0, minute=t_ts.minute + 1)
-                            if nt_ts not in datetable:
-                                cprint(f'\t{t_ts} does not fit raster, skipped')
-                                continue
-                        t_ts = nt_ts
-                    elif resolution in ['day', 'month']:
-                        # correct up to one hour
-                        nt_ts = t_ts.replace(hour=0)
-                        if nt_ts not in datetable:
-                            nt_ts = t_ts.replace(hour=t_ts.hour + 1)
-                            if nt_ts not in datetable:
-                                cprint(f'\t{t_ts} does not fit raster, skipped')
-                                continue
-                        t_ts = nt_ts
+                        nt_ts = raster_fit.get(t_ts.replace(second=0))
+                    else:
+                        nt_ts = raster_fit.get(t_ts.replace(hour=0))
+                    if nt_ts is None:
+                        cprint(f'\t{t_ts} does not fit raster, skipped')
+                        continue
+                    t_ts = nt_ts
                 datetable[t_ts][name] = t_val
 
                 # year statistics stop at 2000-01-02 00:59:59, so if the year hits 2000 we know we're done
@@ -293,31 +302,31 @@ def timeseries2csv(host: str, port: int, output: Optional[str], header_format: b
     if output is None:
         output = f'data_{resolution}_{ts_start.isoformat("T")}.csv'
 
-    if output == '-':
-        fd = sys.stdout
-    else:
-        filedes, filepath = mkstemp(dir=os.path.dirname(output), text=True)
-        fd = open(filedes, 'wt')
+    # assemble the whole table in memory and write it out in a single call
+    table_out = StringIO()
 
     if header_format == 'influx2':
-        fd.write(f'#constant measurement,{resolution}\n')
-        fd.write('#datatype dateTime,field,field,field,field,field,field,field,field,field,field,field,field,field,'
-                 'field,field,field,field,field,field,field,field,field\n')
+        table_out.write(f'#constant measurement,{resolution}\n')
+        table_out.write('#datatype dateTime,field,field,field,field,field,field,field,field,field,field,field,field,'
+                        'field,field,field,field,field,field,field,field,field,field\n')
 
-    writer = csv.writer(fd)
-
-    names = [oid.name.replace(name_prefix, '').replace('_log_ts', '') for oid in oids]
+    writer = csv.writer(table_out)
 
     if header_format == 'simple':
         writer.writerow(['timestamp'] + names)
 
-    for bts, btval in datetable.items():
-        if btval:  # there may be holes in the data
-            writer.writerow([timezone.localize(bts).isoformat('T')] + [str(btval[name]) for name in names])
+    # there may be holes in the data, skip rows without values
+    writer.writerows([bts.replace(tzinfo=timezone).isoformat('T')] + [str(btval[name]) for name in names]
+                     for bts, btval in datetable.items() if btval)
 
-    if output != '-':
-        fd.flush()
-        os.fsync(fd.fileno())
+    if output == '-':
+        sys.stdout.write(table_out.getvalue())
+    else:
+        filedes, filepath = mkstemp(dir=os.path.dirname(output), text=True)
+        with open(filedes, 'wt') as fd:
+            fd.write(table_out.getvalue())
+            fd.flush()
+            os.fsync(fd.fileno())
         try:
             os.rename(filepath, output)
         except OSError as exc: